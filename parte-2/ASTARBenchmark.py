@@ -0,0 +1,90 @@
+import glob
+import os
+import sys
+import time
+
+from ASTARRodaje import AStarAlgorithm, AStarRunner, Heuristics
+
+class AStarBenchmark:
+    # Avión fuera de su meta sobre una casilla 'A' rodeada de 'G': no tiene movimientos legales
+    STUCK_MAP = [['A', 'G'],
+                 ['G', 'B']]
+    STUCK_AIRCRAFTS = [{'init': (0, 0), 'goal': (1, 1)}]
+
+    def __init__(self, csv_routes, repetitions=20):
+        self.csv_routes = csv_routes
+        self.repetitions = repetitions
+
+    @staticmethod
+    def check_equivalence(test_dir, max_expanded_nodes=2000):
+        '''
+        Comprueba que el motor escalar y el vectorial obtienen la misma solución, h inicial y nodos
+        expandidos en todos los mapas de prueba y en un caso con un avión sin movimientos.
+        '''
+        cases = []
+        for csv_route in sorted(glob.glob(os.path.join(test_dir, "*.csv"))):
+            runner = AStarRunner(csv_route, 1)
+            cases.append((os.path.basename(csv_route).split('.')[0], runner.map_data, runner.aircraft))
+        cases.append(("atascado", AStarBenchmark.STUCK_MAP, AStarBenchmark.STUCK_AIRCRAFTS))
+
+        heuristics = [(Heuristics.manhattan_heuristic, Heuristics.manhattan_heuristic_batch),
+                      (Heuristics.max_manhattan_heuristic, Heuristics.max_manhattan_heuristic_batch)]
+        for name_map, map_data, aircrafts in cases:
+            for num_heuristic, (heuristic, batch_heuristic) in enumerate(heuristics, start=1):
+                scalar_result = AStarAlgorithm(map_data, aircrafts, heuristic, max_expanded_nodes).a_star()
+                vector_result = AStarAlgorithm(map_data, aircrafts, heuristic, max_expanded_nodes,
+                                               batch_heuristic=batch_heuristic).a_star()
+                if scalar_result != vector_result:
+                    raise AssertionError(f"Los motores no coinciden en {name_map} con heurística {num_heuristic}")
+        print(f"Motores equivalentes en {len(cases)} mapas con ambas heurísticas.")
+
+    @staticmethod
+    def select_maps(test_dir, n_aircrafts=4):
+        '''
+        Se obtienen los mapas de prueba con el número de aviones indicado.
+        '''
+        routes = []
+        for route in sorted(glob.glob(os.path.join(test_dir, "*.csv"))):
+            with open(route, 'r') as file:
+                if int(file.readline()) == n_aircrafts:
+                    routes.append(route)
+        return routes
+
+    def measure(self, csv_route, num_heuristic, engine):
+        '''
+        Ejecuta A* varias veces con el motor indicado y devuelve el mejor tiempo y el resultado.
+        '''
+        runner = AStarRunner(csv_route, num_heuristic, engine)
+        best = float('inf')
+        result = None
+        for _ in range(self.repetitions):
+            start_time = time.perf_counter()
+            result = runner.a_star_algorithm.a_star()
+            best = min(best, time.perf_counter() - start_time)
+        return best, result
+
+    def run(self):
+        '''
+        Compara el motor escalar y el vectorial en cada mapa y heurística.
+        '''
+        print(f"{'Mapa':<10}{'h':>3}{'Escalar (s)':>15}{'Vectorial (s)':>15}{'Speedup':>10}{'Nodos':>8}")
+        for csv_route in self.csv_routes:
+            name_map = os.path.basename(csv_route).split('.')[0]
+            for num_heuristic in (1, 2):
+                scalar_time, scalar_result = self.measure(csv_route, num_heuristic, 'escalar')
+                vector_time, vector_result = self.measure(csv_route, num_heuristic, 'vectorial')
+                if scalar_result != vector_result:
+                    raise AssertionError(f"Los motores no coinciden en {name_map} con heurística {num_heuristic}")
+                print(f"{name_map:<10}{num_heuristic:>3}{scalar_time:>15.6f}{vector_time:>15.6f}"
+                      f"{scalar_time / vector_time:>9.2f}x{scalar_result[3]:>8}")
+
+if __name__ == "__main__":
+    test_dir = os.path.join(os.path.dirname(__file__), "ASTAR-tests")
+    AStarBenchmark.check_equivalence(test_dir)
+
+    if len(sys.argv) > 1:
+        csv_routes = sys.argv[1:]
+    else:
+        csv_routes = AStarBenchmark.select_maps(test_dir)
+
+    AStarBenchmark(csv_routes).run()
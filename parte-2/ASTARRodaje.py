@@ -3,6 +3,8 @@ import sys
 import time
 from itertools import product
 
+import numpy as np
+
 class Heuristics:
     @staticmethod
     def manhattan_heuristic(positions, goals):
@@ -19,6 +21,20 @@ class Heuristics:
         distances = [abs(x - gx) + abs(y - gy) for (x, y), (gx, gy) in zip(positions, goals)]
         return max(distances)
 
+    @staticmethod
+    def manhattan_heuristic_batch(candidates, goals):
+        '''
+        Version vectorizada de manhattan_heuristic para un lote de candidatos (candidatos x aviones x 2).
+        '''
+        return np.abs(candidates - goals).sum(axis=2).sum(axis=1)
+
+    @staticmethod
+    def max_manhattan_heuristic_batch(candidates, goals):
+        '''
+        Version vectorizada de max_manhattan_heuristic para un lote de candidatos (candidatos x aviones x 2).
+        '''
+        return np.abs(candidates - goals).sum(axis=2).max(axis=1)
+
 class MovementValidator:
     @staticmethod
     def obtain_valid_movements(pos, map_data):
@@ -84,12 +100,120 @@ class SuccessorGenerator:
 
         return successors
 
+class BatchSuccessorGenerator:
+    @staticmethod
+    def generate_candidates(aircrafts, map_data, goals):
+        '''
+        Se generan todos los movimientos conjuntos de un estado como un array (candidatos x aviones x 2),
+        en el mismo orden que itertools.product.
+        '''
+        possible_movements = []
+        for i, pos in enumerate(aircrafts):
+            if pos == goals[i]:
+                possible_movements.append([pos])
+            else:
+                possible_movements.append(MovementValidator.obtain_valid_movements(pos, map_data))
+
+        n_aircrafts = len(aircrafts)
+        counts = [len(m) for m in possible_movements]
+        if 0 in counts:
+            # Algún avión no tiene movimientos legales: no hay sucesores
+            return np.empty((0, n_aircrafts, 2), dtype=np.int64)
+
+        options = np.zeros((n_aircrafts, max(counts), 2), dtype=np.int64)
+        for i, movements in enumerate(possible_movements):
+            options[i, :counts[i]] = movements
+
+        indices = np.indices(counts).reshape(n_aircrafts, -1).T
+        return options[np.arange(n_aircrafts), indices]
+
+    @staticmethod
+    def filter_collisions(candidates, aircrafts, width):
+        '''
+        Devuelve la máscara de candidatos sin colisiones de vértice (dos aviones en la misma casilla)
+        ni de cruce (dos aviones intercambiando sus casillas).
+        '''
+        cells = candidates[:, :, 0] * width + candidates[:, :, 1]
+        current = np.array([x * width + y for x, y in aircrafts], dtype=np.int64)
+
+        sorted_cells = np.sort(cells, axis=1)
+        vertex_collision = (sorted_cells[:, 1:] == sorted_cells[:, :-1]).any(axis=1)
+
+        # moves_into[c, i, j]: en el candidato c, el avión i pasa a la casilla actual del avión j
+        moves_into = cells[:, :, None] == current[None, None, :]
+        swaps = moves_into & moves_into.transpose(0, 2, 1)
+        swaps &= ~np.eye(len(aircrafts), dtype=bool)
+        cross_collision = swaps.any(axis=(1, 2))
+
+        return ~(vertex_collision | cross_collision)
+
+    @staticmethod
+    def build_movement_labels(map_data):
+        '''
+        Se precalculan las etiquetas de movimiento para cada dirección y casilla del mapa.
+        Fila d = (dx + 1) * 3 + (dy + 1), columna = x * ancho + y.
+        '''
+        directions = {(0, 1): '→', (0, -1): '←', (1, 0): '↓', (-1, 0): '↑', (0, 0): 'w'}
+        height, width = len(map_data), len(map_data[0])
+        labels = np.empty((9, height * width), dtype=object)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                movement_label = directions.get((dx, dy), 'w')
+                labels[(dx + 1) * 3 + (dy + 1)] = [f"{movement_label} ({x},{y})"
+                                                    for x in range(height) for y in range(width)]
+        return labels
+
+    @staticmethod
+    def generate_successors(state, map_data, goals, batch_heuristic, labels):
+        '''
+        Se generan los sucesores de un estado dado evaluando colisiones y heurística sobre todo el lote.
+        Devuelve una lista de pares (h, sucesor) con los supervivientes.
+        '''
+        aircrafts = state['posiciones']
+        time = state['tiempo']
+        current_movements = state['movimientos']
+        width = len(map_data[0])
+
+        candidates = BatchSuccessorGenerator.generate_candidates(aircrafts, map_data, goals)
+        valid = BatchSuccessorGenerator.filter_collisions(candidates, aircrafts, width)
+        candidates = candidates[valid]
+        h_values = batch_heuristic(candidates, np.array(goals, dtype=np.int64))
+
+        deltas = candidates - np.array(aircrafts, dtype=np.int64)
+        rows = (deltas[:, :, 0] + 1) * 3 + (deltas[:, :, 1] + 1)
+        cells = candidates[:, :, 0] * width + candidates[:, :, 1]
+        new_labels = labels[rows, cells].tolist()
+
+        successors = []
+        for h, new_positions, step_labels in zip(h_values.tolist(), candidates.tolist(), new_labels):
+            successors.append((h, {
+                'posiciones': [tuple(p) for p in new_positions],
+                'tiempo': time + 1,
+                'movimientos': [m + [label] for m, label in zip(current_movements, step_labels)]
+            }))
+
+        return successors
+
 class AStarAlgorithm:
-    def __init__(self, map_data, aircrafts, heuristic, max_expanded_nodes=100000):
+    def __init__(self, map_data, aircrafts, heuristic, max_expanded_nodes=100000, batch_heuristic=None):
         self.map_data = map_data
         self.aircrafts = aircrafts
         self.heuristic = heuristic
         self.max_expanded_nodes = max_expanded_nodes
+        # Si se indica una heurística vectorizada se usa el motor por lotes de BatchSuccessorGenerator
+        self.batch_heuristic = batch_heuristic
+        if batch_heuristic is not None:
+            self.movement_labels = BatchSuccessorGenerator.build_movement_labels(map_data)
+
+    def expand(self, state, goal):
+        '''
+        Expande un estado devolviendo los pares (h, sucesor) con el motor seleccionado.
+        '''
+        if self.batch_heuristic is not None:
+            return BatchSuccessorGenerator.generate_successors(state, self.map_data, goal, self.batch_heuristic,
+                                                               self.movement_labels)
+        return [(self.heuristic(successor['posiciones'], goal), successor)
+                for successor in SuccessorGenerator.generate_successors(state, self.map_data, goal)]
 
     def a_star(self):
         '''
@@ -129,21 +253,23 @@ class AStarAlgorithm:
                 print("Se ha alcanzado el número máximo de nodos expandidos.")
                 break
 
-            for successor in SuccessorGenerator.generate_successors(state, self.map_data, goal):
+            for h, successor in self.expand(state, goal):
                 counter += 1
-                cost = successor['tiempo'] + self.heuristic(successor['posiciones'], goal)
+                cost = successor['tiempo'] + h
                 queue.append((cost, counter, successor))
 
         return None, None, h_initial, expanded_nodes
 
 class AStarRunner:
-    def __init__(self, csv_route, num_heuristic):
+    def __init__(self, csv_route, num_heuristic, engine='escalar'):
         self.csv_route = csv_route
         self.num_heuristic = num_heuristic
+        self.engine = engine
         self.name_map = os.path.basename(csv_route).split('.')[0]
         self.map_data, self.aircraft = self.read_input()
         self.heuristic = self.select_heuristic()
-        self.a_star_algorithm = AStarAlgorithm(self.map_data, self.aircraft, self.heuristic)
+        self.a_star_algorithm = AStarAlgorithm(self.map_data, self.aircraft, self.heuristic,
+                                               batch_heuristic=self.select_batch_heuristic())
 
     def read_input(self):
         '''
@@ -188,6 +314,21 @@ class AStarRunner:
                   "Use 1 (heuristica de manhattan) o 2 (heuristica maxima de manhattan).")
             sys.exit(1)
 
+    def select_batch_heuristic(self):
+        '''
+        Metodo para seleccionar la heurística vectorizada según el motor elegido.
+        '''
+        if self.engine == 'escalar':
+            return None
+        elif self.engine == 'vectorial':
+            if self.num_heuristic == 1:
+                return Heuristics.manhattan_heuristic_batch
+            return Heuristics.max_manhattan_heuristic_batch
+        else:
+            print("Motor no implementado. "
+                  "Use escalar (por defecto) o vectorial.")
+            sys.exit(1)
+
     def handle_error(self, error):
         '''
         Metodo que maneja los errores y guarda los resultados en un archivo de salida.
@@ -251,12 +392,13 @@ class AStarRunner:
                   f"Tiempo total: {end_time - start_time:.10f} segundos")
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Uso: python ASTARRodaje.py <path mapa00.csv> <num-h>")
+    if len(sys.argv) not in (3, 4):
+        print("Uso: python ASTARRodaje.py <path mapa00.csv> <num-h> [escalar|vectorial]")
         sys.exit(1)
 
     csv_route = sys.argv[1]
     num_heuristic = int(sys.argv[2])
+    engine = sys.argv[3] if len(sys.argv) == 4 else 'escalar'
 
-    runner = AStarRunner(csv_route, num_heuristic)
+    runner = AStarRunner(csv_route, num_heuristic, engine)
     runner.run()
\ No newline at end of file